@@ -1,21 +1,57 @@
+import atexit
+import codecs
+import hashlib
 import os
+import shutil
+import tempfile
+from collections import OrderedDict
 from subprocess import Popen, PIPE, STDOUT
 import logging
 
 import mlflow
 import mlflow.version
-from mlflow.utils.file_utils import TempDir, _copy_project
+from mlflow.utils.file_utils import TempDir, _copy_project, _docker_ignore
 from mlflow.utils.logging_utils import eprint
 
 _logger = logging.getLogger(__name__)
 
 DISABLE_ENV_CREATION = "MLFLOW_DISABLE_ENV_CREATION"
 
-_DOCKERFILE_TEMPLATE = """
+_BUILD_OUTPUT_CHUNK_SIZE = 64 * 1024
+
+# Sanitized copies of MLflow source trees that are reused across image builds in the same
+# process, keyed by a fingerprint of the source tree. Values are the directories holding
+# the copies
+_MLFLOW_HOME_COPIES = OrderedDict()
+_MLFLOW_HOME_COPIES_MAX_SIZE = 4
+
+# Paths of an MLflow source tree that are not needed to install MLflow in an image. They are
+# excluded from the build context in case the source tree's own .dockerignore doesn't exclude them
+_MLFLOW_HOME_DOCKERIGNORE_PATTERNS = [
+    ".git",
+    ".venv",
+    "tests",
+    "docs",
+    "examples",
+    "mlruns",
+    "**/__pycache__",
+    "**/*.pyc",
+]
+
+_MINICONDA_INSTALLER = "Miniconda3-py39_4.10.3-Linux-x86_64.sh"
+_MINICONDA_INSTALLER_SHA256 = "1ea2f885b4dbc3098662845560bc64271eb17085387a70c2ba3f29fff6f8d52f"
+
+_DOCKERFILE_TEMPLATE = """# syntax=docker/dockerfile:1.4
 # Build an image that can serve mlflow models.
 FROM ubuntu:18.04
 
-RUN apt-get -y update && apt-get install -y --no-install-recommends \
+# Keep downloaded packages, and reuse them and the package lists across builds through BuildKit
+# cache mounts. The mounted directories are not part of the image, so they don't need cleaning up
+RUN rm -f /etc/apt/apt.conf.d/docker-clean \
+    && echo 'Binary::apt::APT::Keep-Downloaded-Packages "true";' > /etc/apt/apt.conf.d/keep-cache
+RUN --mount=type=cache,target=/var/cache/apt,sharing=locked \
+    --mount=type=cache,target=/var/lib/apt,sharing=locked \
+    apt-get -y update && apt-get install -y --no-install-recommends \
          wget \
          curl \
          nginx \
@@ -25,12 +61,13 @@ RUN apt-get -y update && apt-get install -y --no-install-recommends \
          cmake \
          openjdk-8-jdk \
          git-core \
-         maven \
-    && rm -rf /var/lib/apt/lists/*
+         maven
 
-# Download and setup miniconda
-RUN curl -L https://repo.anaconda.com/miniconda/Miniconda3-latest-Linux-x86_64.sh >> miniconda.sh
-RUN bash ./miniconda.sh -b -p /miniconda && rm ./miniconda.sh
+# Download and setup miniconda. The installer is pinned to a specific release and verified against
+# its published checksum so that every build of this layer produces the same environment
+RUN curl -fL https://repo.anaconda.com/miniconda/{miniconda_installer} -o miniconda.sh \
+    && echo "{miniconda_installer_sha256}  miniconda.sh" | sha256sum -c - \
+    && bash ./miniconda.sh -b -p /miniconda && rm ./miniconda.sh
 ENV PATH="/miniconda/bin:$PATH"
 ENV JAVA_HOME=/usr/lib/jvm/java-8-openjdk-amd64
 ENV GUNICORN_CMD_ARGS="--timeout 60 -k gevent"
@@ -44,13 +81,100 @@ WORKDIR /opt/mlflow
 """
 
 
+def _fingerprint_mlflow_home(mlflow_home):
+    """
+    Computes a fingerprint of the files that ``_copy_project`` copies from the specified MLflow
+    source tree, based on their relative paths, modification times and sizes.
+    """
+    ignore = _docker_ignore(mlflow_home)
+    digest = hashlib.sha256()
+    # `shutil.copytree` follows symlinks to directories, so the walk does too
+    for root, dirs, files in os.walk(mlflow_home, followlinks=True):
+        ignored = set(ignore(root, dirs + files)) if ignore else set()
+        dirs[:] = sorted(d for d in dirs if d not in ignored)
+        for name in sorted(f for f in files if f not in ignored):
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            entry = "%s\0%d\0%d\0" % (
+                os.path.relpath(path, mlflow_home),
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+            digest.update(entry.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _remove_mlflow_home_copies():
+    while _MLFLOW_HOME_COPIES:
+        _, copy_dir = _MLFLOW_HOME_COPIES.popitem()
+        shutil.rmtree(copy_dir, ignore_errors=True)
+
+
+atexit.register(_remove_mlflow_home_copies)
+
+
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Hard links are not supported across file systems or on some file systems
+        shutil.copy2(src, dst)
+
+
+def _copy_mlflow_home(mlflow_home, dockerfile_context_dir):
+    """
+    Copies the specified MLflow source tree into the docker context directory like
+    ``_copy_project``. The sanitized copy is cached for as long as the source tree is unchanged,
+    and subsequent calls hard link its files into the context directory instead of copying the
+    whole source tree again.
+
+    :return: Name of the MLflow project directory within ``dockerfile_context_dir``.
+    """
+    fingerprint = _fingerprint_mlflow_home(mlflow_home)
+    copy_dir = _MLFLOW_HOME_COPIES.get(fingerprint)
+    mlflow_dir = None
+    if copy_dir is not None:
+        try:
+            mlflow_dir = os.listdir(copy_dir)[0]
+            _MLFLOW_HOME_COPIES.move_to_end(fingerprint)
+        except (FileNotFoundError, IndexError):
+            # The copy was removed from under us, e.g. by a temporary directory cleaner
+            _logger.debug("Cached copy of %s in %s is gone, copying again", mlflow_home, copy_dir)
+            del _MLFLOW_HOME_COPIES[fingerprint]
+            shutil.rmtree(copy_dir, ignore_errors=True)
+    if mlflow_dir is None:
+        copy_dir = tempfile.mkdtemp()
+        try:
+            mlflow_dir = _copy_project(src_path=mlflow_home, dst_path=copy_dir)
+        except BaseException:
+            shutil.rmtree(copy_dir, ignore_errors=True)
+            raise
+        _MLFLOW_HOME_COPIES[fingerprint] = copy_dir
+        if len(_MLFLOW_HOME_COPIES) > _MLFLOW_HOME_COPIES_MAX_SIZE:
+            _, evicted_dir = _MLFLOW_HOME_COPIES.popitem(last=False)
+            shutil.rmtree(evicted_dir, ignore_errors=True)
+    shutil.copytree(
+        os.path.join(copy_dir, mlflow_dir),
+        os.path.join(dockerfile_context_dir, mlflow_dir),
+        copy_function=_link_or_copy,
+    )
+    return mlflow_dir
+
+
 def _get_mlflow_install_step(dockerfile_context_dir, mlflow_home):
     """
     Get docker build commands for installing MLflow given a Docker context dir and optional source
     directory
     """
     if mlflow_home:
-        mlflow_dir = _copy_project(src_path=mlflow_home, dst_path=dockerfile_context_dir)
+        mlflow_dir = _copy_mlflow_home(mlflow_home, dockerfile_context_dir)
+        with open(os.path.join(dockerfile_context_dir, ".dockerignore"), "w") as f:
+            f.write(
+                "".join(
+                    "{mlflow_dir}/{pattern}\n".format(mlflow_dir=mlflow_dir, pattern=pattern)
+                    for pattern in _MLFLOW_HOME_DOCKERIGNORE_PATTERNS
+                )
+            )
         return (
             "COPY {mlflow_dir} /opt/mlflow\n"
             "RUN pip install /opt/mlflow\n"
@@ -99,13 +223,18 @@ def _build_image(image_name, entrypoint, mlflow_home=None, custom_setup_steps_ho
         with open(os.path.join(cwd, "Dockerfile"), "w") as f:
             f.write(
                 _DOCKERFILE_TEMPLATE.format(
+                    miniconda_installer=_MINICONDA_INSTALLER,
+                    miniconda_installer_sha256=_MINICONDA_INSTALLER_SHA256,
                     install_mlflow=install_mlflow,
                     custom_setup_steps=custom_setup_steps,
                     entrypoint=entrypoint,
                 )
             )
         _logger.info("Building docker image with name %s", image_name)
-        os.system("find {cwd}/".format(cwd=cwd))
+        if _logger.isEnabledFor(logging.DEBUG):
+            for root, _, files in os.walk(cwd):
+                for file_name in files:
+                    _logger.debug("Docker build context file: %s", os.path.join(root, file_name))
         proc = Popen(
             [
                 "docker",
@@ -117,15 +246,25 @@ def _build_image(image_name, entrypoint, mlflow_home=None, custom_setup_steps_ho
                 # Enforcing the AMD64 architecture build for Apple M1 users
                 "--platform",
                 "linux/amd64",
+                # Reuse the layers of a previous build of the image, e.g. the expensive apt-get and
+                # miniconda installation layers, even if they are no longer in the local cache
+                "--cache-from",
+                image_name,
+                "--build-arg",
+                "BUILDKIT_INLINE_CACHE=1",
                 ".",
             ],
             cwd=cwd,
             stdout=PIPE,
             stderr=STDOUT,
-            universal_newlines=True,
+            env={**os.environ, "DOCKER_BUILDKIT": "1"},
         )
-        for x in iter(proc.stdout.readline, ""):
-            eprint(x, end="")
+        # Forward the build output in large chunks rather than line by line. The output is
+        # decoded incrementally so that multi-byte characters split across chunks are preserved
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        for chunk in iter(lambda: proc.stdout.read1(_BUILD_OUTPUT_CHUNK_SIZE), b""):
+            eprint(decoder.decode(chunk), end="")
+        eprint(decoder.decode(b"", final=True), end="")
 
         if proc.wait():
             raise RuntimeError("Docker build failed.")
@@ -25,7 +25,7 @@ from mlflow.protos.model_registry_pb2 import (
 )
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.model_registry.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
+from mlflow.utils.proto_json_utils import message_to_dict
 from mlflow.utils.rest_utils import (
     call_endpoint,
     extract_api_info_for_service,
@@ -71,7 +71,7 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
+        req_body = message_to_dict(
             CreateRegisteredModel(name=name, tags=proto_tags, description=description)
         )
         response_proto = self._call_endpoint(CreateRegisteredModel, req_body)
@@ -85,7 +85,7 @@ class RestStore(AbstractStore):
         :param description: New description.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(UpdateRegisteredModel(name=name, description=description))
+        req_body = message_to_dict(UpdateRegisteredModel(name=name, description=description))
         response_proto = self._call_endpoint(UpdateRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -97,7 +97,7 @@ class RestStore(AbstractStore):
         :param new_name: New proposed name.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(RenameRegisteredModel(name=name, new_name=new_name))
+        req_body = message_to_dict(RenameRegisteredModel(name=name, new_name=new_name))
         response_proto = self._call_endpoint(RenameRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -109,7 +109,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModel(name=name))
+        req_body = message_to_dict(DeleteRegisteredModel(name=name))
         self._call_endpoint(DeleteRegisteredModel, req_body)
 
     def list_registered_models(self, max_results, page_token):
@@ -123,7 +123,7 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             ListRegisteredModels(page_token=page_token, max_results=max_results)
         )
         response_proto = self._call_endpoint(ListRegisteredModels, req_body)
@@ -151,7 +151,7 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             SearchRegisteredModels(
                 filter=filter_string,
                 max_results=max_results,
@@ -173,7 +173,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(GetRegisteredModel(name=name))
+        req_body = message_to_dict(GetRegisteredModel(name=name))
         response_proto = self._call_endpoint(GetRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -187,7 +187,7 @@ class RestStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        req_body = message_to_json(GetLatestVersions(name=name, stages=stages))
+        req_body = message_to_dict(GetLatestVersions(name=name, stages=stages))
         response_proto = self._call_endpoint(GetLatestVersions, req_body)
         return [
             ModelVersion.from_proto(model_version)
@@ -202,7 +202,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.RegisteredModelTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(SetRegisteredModelTag(name=name, key=tag.key, value=tag.value))
+        req_body = message_to_dict(SetRegisteredModelTag(name=name, key=tag.key, value=tag.value))
         self._call_endpoint(SetRegisteredModelTag, req_body)
 
     def delete_registered_model_tag(self, name, key):
@@ -213,7 +213,7 @@ class RestStore(AbstractStore):
         :param key: Registered model tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModelTag(name=name, key=key))
+        req_body = message_to_dict(DeleteRegisteredModelTag(name=name, key=key))
         self._call_endpoint(DeleteRegisteredModelTag, req_body)
 
     # CRUD API for ModelVersion objects
@@ -235,7 +235,7 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
+        req_body = message_to_dict(
             CreateModelVersion(
                 name=name,
                 source=source,
@@ -261,7 +261,7 @@ class RestStore(AbstractStore):
 
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             TransitionModelVersionStage(
                 name=name,
                 version=str(version),
@@ -281,7 +281,7 @@ class RestStore(AbstractStore):
         :param description: New model description.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             UpdateModelVersion(name=name, version=str(version), description=description)
         )
         response_proto = self._call_endpoint(UpdateModelVersion, req_body)
@@ -295,7 +295,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersion(name=name, version=str(version)))
+        req_body = message_to_dict(DeleteModelVersion(name=name, version=str(version)))
         self._call_endpoint(DeleteModelVersion, req_body)
 
     def get_model_version(self, name, version):
@@ -306,7 +306,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(GetModelVersion(name=name, version=str(version)))
+        req_body = message_to_dict(GetModelVersion(name=name, version=str(version)))
         response_proto = self._call_endpoint(GetModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
@@ -320,7 +320,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single URI location that allows reads for downloading.
         """
-        req_body = message_to_json(GetModelVersionDownloadUri(name=name, version=str(version)))
+        req_body = message_to_dict(GetModelVersionDownloadUri(name=name, version=str(version)))
         response_proto = self._call_endpoint(GetModelVersionDownloadUri, req_body)
         return response_proto.artifact_uri
 
@@ -334,7 +334,7 @@ class RestStore(AbstractStore):
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
                  objects.
         """
-        req_body = message_to_json(SearchModelVersions(filter=filter_string))
+        req_body = message_to_dict(SearchModelVersions(filter=filter_string))
         response_proto = self._call_endpoint(SearchModelVersions, req_body)
         model_versions = [ModelVersion.from_proto(mvd) for mvd in response_proto.model_versions]
         return PagedList(model_versions, response_proto.next_page_token)
@@ -348,7 +348,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.ModelVersionTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             SetModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
         )
         self._call_endpoint(SetModelVersionTag, req_body)
@@ -362,5 +362,5 @@ class RestStore(AbstractStore):
         :param key: Tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersionTag(name=name, version=version, key=key))
+        req_body = message_to_dict(DeleteModelVersionTag(name=name, version=version, key=key))
         self._call_endpoint(DeleteModelVersionTag, req_body)
@@ -1,3 +1,6 @@
+import json
+from collections import OrderedDict
+
 from mlflow.entities import Experiment, Run, RunInfo, Metric, ViewType
 from mlflow.exceptions import MlflowException
 from mlflow.protos import databricks_pb2
@@ -27,15 +30,101 @@ from mlflow.protos.service_pb2 import (
 )
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.utils.proto_json_utils import message_to_json
+from mlflow.utils import _chunk_batch_entities
+from mlflow.utils.proto_json_utils import message_to_dict, parse_dict
 from mlflow.utils.rest_utils import (
     call_endpoint,
+    _call_endpoint_json,
     extract_api_info_for_service,
     _REST_API_PATH_PREFIX,
 )
 
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
 
+# For each API whose requests ``call_endpoints_batched`` converts into ``LogBatch`` entries, the
+# ``LogBatch`` field that the entries are added to and the request fields that make up an entry
+_BATCH_ENTRY_FIELDS = {
+    LogMetric: ("metrics", ("key", "value", "timestamp", "step")),
+    LogParam: ("params", ("key", "value")),
+    SetTag: ("tags", ("key", "value")),
+}
+
+
+def _invalid_batched_request(message):
+    return MlflowException(
+        "Cannot batch request: %s" % message, error_code=databricks_pb2.INVALID_PARAMETER_VALUE
+    )
+
+
+def call_endpoints_batched(host_creds, requests_iter):
+    """
+    Coalesces ``LogBatch``, ``LogMetric``, ``LogParam`` and ``SetTag`` requests into ``LogBatch``
+    requests, one per run or as many per run as the tracking server's batch limits require, and
+    issues them over the shared session.
+
+    All requests are validated before any of them is issued. An ``MlflowException`` is raised if a
+    request targets any other endpoint, doesn't have a JSON object body that specifies a run ID,
+    or contains fields that are not part of its endpoint's request message.
+
+    :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
+        hostname and optional authentication.
+    :param requests_iter: Iterable of ``(endpoint, method, json_body, response_proto)`` tuples,
+        as they would be passed to ``call_endpoint``. ``json_body`` is a dictionary or a
+        serialized JSON string.
+    :return: List of the ``response_proto`` objects from ``requests_iter``, in the same order.
+        Each one is populated from the response to the last ``LogBatch`` request issued for its
+        run.
+    """
+    batchable_apis = {_METHOD_TO_INFO[api]: api for api in [LogBatch, *_BATCH_ENTRY_FIELDS]}
+
+    runs = OrderedDict()
+    response_protos = []
+    for endpoint, method, json_body, response_proto in requests_iter:
+        api = batchable_apis.get((endpoint, method))
+        if api is None:
+            raise _invalid_batched_request(
+                "%s %s is not a LogBatch, LogMetric, LogParam or SetTag endpoint"
+                % (method, endpoint)
+            )
+        if isinstance(json_body, (bytes, str)):
+            json_body = json.loads(json_body)
+        if not isinstance(json_body, dict):
+            raise _invalid_batched_request(
+                "body for endpoint %s is not a JSON object: %r" % (endpoint, json_body)
+            )
+        unknown_fields = set(json_body) - {field.name for field in api.DESCRIPTOR.fields}
+        if unknown_fields:
+            raise _invalid_batched_request(
+                "unknown fields %s for endpoint %s" % (sorted(unknown_fields), endpoint)
+            )
+        run_id = json_body.get("run_id") or json_body.get("run_uuid")
+        if not run_id:
+            raise _invalid_batched_request("no run ID specified for endpoint %s" % endpoint)
+
+        if run_id not in runs:
+            runs[run_id] = ({"metrics": [], "params": [], "tags": []}, [])
+        entries, run_response_protos = runs[run_id]
+        if api is LogBatch:
+            for field, field_entries in entries.items():
+                field_entries.extend(json_body.get(field, []))
+        else:
+            field, entry_fields = _BATCH_ENTRY_FIELDS[api]
+            entries[field].append({f: json_body[f] for f in entry_fields if f in json_body})
+        run_response_protos.append(response_proto)
+        response_protos.append(response_proto)
+
+    endpoint, method = _METHOD_TO_INFO[LogBatch]
+    for run_id, (entries, run_response_protos) in runs.items():
+        js_dict = {}
+        for metrics, params, tags in _chunk_batch_entities(
+            entries["metrics"], entries["params"], entries["tags"]
+        ):
+            body = {"run_id": run_id, "metrics": metrics, "params": params, "tags": tags}
+            js_dict = _call_endpoint_json(host_creds, endpoint, method, body)
+        for response_proto in run_response_protos:
+            parse_dict(js_dict=js_dict, message=response_proto)
+    return response_protos
+
 
 class RestStore(AbstractStore):
     """
@@ -68,7 +157,7 @@ class RestStore(AbstractStore):
                  :py:class:`Experiment <mlflow.entities.Experiment>` objects. The pagination token
                  for the next page can be obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             ListExperiments(view_type=view_type, max_results=max_results, page_token=page_token)
         )
         response_proto = self._call_endpoint(ListExperiments, req_body)
@@ -89,7 +178,7 @@ class RestStore(AbstractStore):
 
         :return: experiment_id (string) for the newly created experiment if successful, else None
         """
-        req_body = message_to_json(CreateExperiment(name=name, artifact_location=artifact_location))
+        req_body = message_to_dict(CreateExperiment(name=name, artifact_location=artifact_location))
         response_proto = self._call_endpoint(CreateExperiment, req_body)
         return response_proto.experiment_id
 
@@ -102,20 +191,20 @@ class RestStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.Experiment` object if it exists,
         otherwise raises an Exception.
         """
-        req_body = message_to_json(GetExperiment(experiment_id=str(experiment_id)))
+        req_body = message_to_dict(GetExperiment(experiment_id=str(experiment_id)))
         response_proto = self._call_endpoint(GetExperiment, req_body)
         return Experiment.from_proto(response_proto.experiment)
 
     def delete_experiment(self, experiment_id):
-        req_body = message_to_json(DeleteExperiment(experiment_id=str(experiment_id)))
+        req_body = message_to_dict(DeleteExperiment(experiment_id=str(experiment_id)))
         self._call_endpoint(DeleteExperiment, req_body)
 
     def restore_experiment(self, experiment_id):
-        req_body = message_to_json(RestoreExperiment(experiment_id=str(experiment_id)))
+        req_body = message_to_dict(RestoreExperiment(experiment_id=str(experiment_id)))
         self._call_endpoint(RestoreExperiment, req_body)
 
     def rename_experiment(self, experiment_id, new_name):
-        req_body = message_to_json(
+        req_body = message_to_dict(
             UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
         )
         self._call_endpoint(UpdateExperiment, req_body)
@@ -128,13 +217,13 @@ class RestStore(AbstractStore):
 
         :return: A single Run object if it exists, otherwise raises an Exception
         """
-        req_body = message_to_json(GetRun(run_uuid=run_id, run_id=run_id))
+        req_body = message_to_dict(GetRun(run_uuid=run_id, run_id=run_id))
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
     def update_run_info(self, run_id, run_status, end_time):
         """ Updates the metadata of the specified run. """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status, end_time=end_time)
         )
         response_proto = self._call_endpoint(UpdateRun, req_body)
@@ -152,7 +241,7 @@ class RestStore(AbstractStore):
         :return: The created Run object
         """
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
+        req_body = message_to_dict(
             CreateRun(
                 experiment_id=str(experiment_id),
                 user_id=user_id,
@@ -171,7 +260,7 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param metric: Metric instance to log
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             LogMetric(
                 run_uuid=run_id,
                 run_id=run_id,
@@ -190,7 +279,7 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param param: Param instance to log
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             LogParam(run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
         )
         self._call_endpoint(LogParam, req_body)
@@ -202,7 +291,7 @@ class RestStore(AbstractStore):
         :param experiment_id: String ID of the experiment
         :param tag: ExperimentRunTag instance to log
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             SetExperimentTag(experiment_id=experiment_id, key=tag.key, value=tag.value)
         )
         self._call_endpoint(SetExperimentTag, req_body)
@@ -214,7 +303,7 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param tag: RunTag instance to log
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             SetTag(run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
         )
         self._call_endpoint(SetTag, req_body)
@@ -225,7 +314,7 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param key: Name of the tag
         """
-        req_body = message_to_json(DeleteTag(run_id=run_id, key=key))
+        req_body = message_to_dict(DeleteTag(run_id=run_id, key=key))
         self._call_endpoint(DeleteTag, req_body)
 
     def get_metric_history(self, run_id, metric_key):
@@ -237,7 +326,7 @@ class RestStore(AbstractStore):
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        req_body = message_to_json(
+        req_body = message_to_dict(
             GetMetricHistory(run_uuid=run_id, run_id=run_id, metric_key=metric_key)
         )
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
@@ -255,7 +344,7 @@ class RestStore(AbstractStore):
             order_by=order_by,
             page_token=page_token,
         )
-        req_body = message_to_json(sr)
+        req_body = message_to_dict(sr)
         response_proto = self._call_endpoint(SearchRuns, req_body)
         runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
         # If next_page_token is not set, we will see it as "". We need to convert this to None.
@@ -265,16 +354,16 @@ class RestStore(AbstractStore):
         return runs, next_page_token
 
     def delete_run(self, run_id):
-        req_body = message_to_json(DeleteRun(run_id=run_id))
+        req_body = message_to_dict(DeleteRun(run_id=run_id))
         self._call_endpoint(DeleteRun, req_body)
 
     def restore_run(self, run_id):
-        req_body = message_to_json(RestoreRun(run_id=run_id))
+        req_body = message_to_dict(RestoreRun(run_id=run_id))
         self._call_endpoint(RestoreRun, req_body)
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = message_to_dict(GetExperimentByName(experiment_name=experiment_name))
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -296,13 +385,13 @@ class RestStore(AbstractStore):
         metric_protos = [metric.to_proto() for metric in metrics]
         param_protos = [param.to_proto() for param in params]
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
+        req_body = message_to_dict(
             LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id)
         )
         self._call_endpoint(LogBatch, req_body)
 
     def record_logged_model(self, run_id, mlflow_model):
-        req_body = message_to_json(LogModel(run_id=run_id, model_json=mlflow_model.to_json()))
+        req_body = message_to_dict(LogModel(run_id=run_id, model_json=mlflow_model.to_json()))
         self._call_endpoint(LogModel, req_body)
 
 
@@ -317,7 +406,7 @@ class DatabricksRestStore(RestStore):
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = message_to_dict(GetExperimentByName(experiment_name=experiment_name))
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -1,5 +1,5 @@
 import logging
-from itertools import islice
+from itertools import islice, zip_longest
 from sys import version_info
 
 
@@ -68,6 +68,33 @@ def chunk_list(l, chunk_size):
         yield l[i : i + chunk_size]
 
 
+def _chunk_batch_entities(metrics, params, tags):
+    """
+    Splits the specified lists of metrics, params and tags into ``(metrics, params, tags)``
+    batches that respect the per-request limits of the ``LogBatch`` API.
+    """
+    from mlflow.utils.validation import (
+        MAX_ENTITIES_PER_BATCH,
+        MAX_METRICS_PER_BATCH,
+        MAX_PARAMS_TAGS_PER_BATCH,
+    )
+
+    for params_batch, tags_batch in zip_longest(
+        chunk_list(params, MAX_PARAMS_TAGS_PER_BATCH),
+        chunk_list(tags, MAX_PARAMS_TAGS_PER_BATCH),
+        fillvalue=[],
+    ):
+        metrics_batch_size = min(
+            MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch), MAX_METRICS_PER_BATCH
+        )
+        metrics_batch_size = max(metrics_batch_size, 0)
+        metrics_batch, metrics = metrics[:metrics_batch_size], metrics[metrics_batch_size:]
+        yield metrics_batch, params_batch, tags_batch
+
+    for metrics_batch in chunk_list(metrics, MAX_METRICS_PER_BATCH):
+        yield metrics_batch, [], []
+
+
 def _chunk_dict(d, chunk_size):
     """
     Splits a dictionary into chunks of the specified size.
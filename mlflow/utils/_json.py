@@ -0,0 +1,28 @@
+"""
+JSON decoding for hot paths (e.g. parsing REST API responses) that uses ``orjson`` when it is
+installed and falls back to the standard library ``json`` module otherwise.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(s):
+    """
+    Deserializes ``s`` (a ``str`` or ``bytes`` instance containing a JSON document) to a Python
+    object.
+
+    ``orjson`` is stricter than the standard library: it rejects non-standard literals such as
+    ``NaN`` and ``Infinity`` as well as integers that don't fit in 64 bits. Documents that
+    ``orjson`` rejects are parsed again with ``json.loads`` so that the result is the same as if
+    ``orjson`` were not installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(s)
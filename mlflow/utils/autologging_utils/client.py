@@ -13,20 +13,17 @@ import time
 import logging
 from collections import namedtuple
 from concurrent.futures import ThreadPoolExecutor
-from itertools import zip_longest
 from typing import Any, Dict, Optional, Union
 
 from mlflow.entities import Param, RunTag, Metric
 from mlflow.exceptions import MlflowException
 from mlflow.tracking.client import MlflowClient
-from mlflow.utils import chunk_list, _truncate_dict
+from mlflow.utils import _chunk_batch_entities, _truncate_dict
 from mlflow.utils.validation import (
     MAX_ENTITIES_PER_BATCH,
     MAX_ENTITY_KEY_LENGTH,
     MAX_TAG_VAL_LENGTH,
     MAX_PARAM_VAL_LENGTH,
-    MAX_PARAMS_TAGS_PER_BATCH,
-    MAX_METRICS_PER_BATCH,
 )
 
 
@@ -291,22 +288,11 @@ class MlflowAutologgingQueueingClient:
 
         operation_results = []
 
-        param_batches_to_log = chunk_list(
-            pending_operations.params_queue, chunk_size=MAX_PARAMS_TAGS_PER_BATCH,
-        )
-        tag_batches_to_log = chunk_list(
-            pending_operations.tags_queue, chunk_size=MAX_PARAMS_TAGS_PER_BATCH,
-        )
-        for params_batch, tags_batch in zip_longest(
-            param_batches_to_log, tag_batches_to_log, fillvalue=[]
+        for metrics_batch, params_batch, tags_batch in _chunk_batch_entities(
+            pending_operations.metrics_queue,
+            pending_operations.params_queue,
+            pending_operations.tags_queue,
         ):
-            metrics_batch_size = min(
-                MAX_ENTITIES_PER_BATCH - len(params_batch) - len(tags_batch), MAX_METRICS_PER_BATCH,
-            )
-            metrics_batch_size = max(metrics_batch_size, 0)
-            metrics_batch = pending_operations.metrics_queue[:metrics_batch_size]
-            pending_operations.metrics_queue = pending_operations.metrics_queue[metrics_batch_size:]
-
             operation_results.append(
                 self._try_operation(
                     self._client.log_batch,
@@ -317,13 +303,6 @@ class MlflowAutologgingQueueingClient:
                 )
             )
 
-        for metrics_batch in chunk_list(
-            pending_operations.metrics_queue, chunk_size=MAX_METRICS_PER_BATCH
-        ):
-            operation_results.append(
-                self._try_operation(self._client.log_batch, run_id=run_id, metrics=metrics_batch,)
-            )
-
         if pending_operations.set_terminated:
             operation_results.append(
                 self._try_operation(
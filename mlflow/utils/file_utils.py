@@ -300,6 +300,28 @@ def make_tarfile(output_filename, source_dir, archive_name, custom_filter=None):
         os.remove(unzipped_filename)
 
 
+def _docker_ignore(mlflow_root):
+    """
+    Returns a ``shutil.copytree`` ignore function for the patterns defined in the .dockerignore
+    file of the specified MLflow project, or ``None`` if there are no such patterns.
+    """
+    docker_ignore = os.path.join(mlflow_root, ".dockerignore")
+    patterns = []
+    if os.path.exists(docker_ignore):
+        with open(docker_ignore, "r") as f:
+            patterns = [x.strip() for x in f.readlines()]
+
+    def ignore(_, names):
+        import fnmatch
+
+        res = set()
+        for p in patterns:
+            res.update(set(fnmatch.filter(names, p)))
+        return list(res)
+
+    return ignore if patterns else None
+
+
 def _copy_project(src_path, dst_path=""):
     """
     Internal function used to copy MLflow project during development.
@@ -311,24 +333,6 @@ def _copy_project(src_path, dst_path=""):
     :param dst_path: MLflow will be copied here
     :return: name of the MLflow project directory
     """
-
-    def _docker_ignore(mlflow_root):
-        docker_ignore = os.path.join(mlflow_root, ".dockerignore")
-        patterns = []
-        if os.path.exists(docker_ignore):
-            with open(docker_ignore, "r") as f:
-                patterns = [x.strip() for x in f.readlines()]
-
-        def ignore(_, names):
-            import fnmatch
-
-            res = set()
-            for p in patterns:
-                res.update(set(fnmatch.filter(names, p)))
-            return list(res)
-
-        return ignore if patterns else None
-
     mlflow_dir = "mlflow-project"
     # check if we have project root
     assert os.path.isfile(os.path.join(src_path, "setup.py")), "file not found " + str(
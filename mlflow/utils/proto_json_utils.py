@@ -3,7 +3,7 @@ import datetime
 
 from json import JSONEncoder
 
-from google.protobuf.json_format import MessageToJson, ParseDict
+from google.protobuf.json_format import MessageToDict, MessageToJson, ParseDict
 
 from mlflow.exceptions import MlflowException
 from collections import defaultdict
@@ -14,6 +14,11 @@ def message_to_json(message):
     return MessageToJson(message, preserving_proto_field_name=True)
 
 
+def message_to_dict(message):
+    """Converts a message to a JSON dictionary, using snake_case for field names."""
+    return MessageToDict(message, preserving_proto_field_name=True)
+
+
 def _stringify_all_experiment_ids(x):
     """Converts experiment_id fields which are defined as ints into strings in the given json.
     This is necessary for backwards- and forwards-compatibility with MLflow clients/servers
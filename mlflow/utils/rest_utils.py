@@ -1,15 +1,21 @@
 import base64
+import os
+import re
 import time
 import logging
 import json
 import requests
 from contextlib import contextmanager
+from functools import lru_cache
+from http.cookiejar import DefaultCookiePolicy
+from types import MappingProxyType
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils import _json
 from mlflow.utils.proto_json_utils import parse_dict
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
@@ -21,9 +27,81 @@ _logger = logging.getLogger(__name__)
 
 _DEFAULT_HEADERS = {"User-Agent": "mlflow-python-client/%s" % __version__}
 
+# Response codes that generally indicate transient network failures and merit client retries,
+# based on guidance from cloud service providers
+# (https://docs.microsoft.com/en-us/azure/architecture/best-practices/retry-service-specific#general-rest-and-retry-guidelines)
+TRANSIENT_FAILURE_RESPONSE_CODES = [
+    408,  # Request Timeout
+    429,  # Too Many Requests
+    500,  # Internal Server Error
+    502,  # Bad Gateway
+    503,  # Service Unavailable
+    504,  # Gateway Timeout
+]
+
+
+@lru_cache(maxsize=64)
+def _get_request_session(verify=True, cert=None, status_retries=None, retry_codes=()):
+    """
+    Returns a cached ``requests.Session`` so that connections to the same host are kept alive
+    and reused across requests instead of paying for a new TCP / TLS handshake on every call.
+
+    Sessions are cached per TLS configuration: before requests 2.32, a pooled connection keeps the
+    certificate verification settings and client certificate it was opened with, so connections
+    must not be shared between requests that use different ones.
+
+    :param verify: Value of ``requests.Session.verify`` for the session, i.e. whether, or against
+                   which CA bundle, server certificates are verified.
+    :param cert: Value of ``requests.Session.cert`` for the session, i.e. the path to the client
+                 certificate to present, if any.
+    :param status_retries: Number of times the underlying ``HTTPAdapter`` retries requests that
+                           fail with one of ``retry_codes``, using exponential backoff. If
+                           ``None``, the adapter does not retry and retries are left to the
+                           caller.
+    :param retry_codes: Tuple of HTTP response codes that are retried when ``status_retries``
+                        is set.
+    """
+    if status_retries is None:
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+    else:
+        retry_strategy = Retry(
+            total=None,
+            # Don't retry on connect-related errors raised before a request reaches a remote server
+            connect=0,
+            # Retry once for errors reading the response from a remote server
+            read=1,
+            # Limit the number of redirects to avoid infinite redirect loops
+            redirect=3,
+            # Retry a specified number of times for response codes indicating transient failures
+            status=status_retries,
+            status_forcelist=retry_codes,
+            backoff_factor=1,
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry_strategy)
+    session = requests.Session()
+    session.verify = verify
+    session.cert = cert
+    # The session is shared by all requests in the process, regardless of their credentials, so it
+    # must not store cookies from one response and send them with subsequent requests
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Pooled connections must not be shared between a parent process and its forked children
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_get_request_session.cache_clear)
+
 
 def http_request(
-    host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
+    host_creds,
+    endpoint,
+    retries=3,
+    retry_interval=3,
+    max_rate_limit_interval=60,
+    extra_headers=None,
+    **kwargs
 ):
     """
     Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
@@ -34,32 +112,21 @@ def http_request(
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param extra_headers: (Optional) Dictionary of headers to send in addition to the default,
+        plugin-provided and authentication headers.
     :return: Parsed API response
     """
-    hostname = host_creds.host
-    auth_str = None
-    if host_creds.username and host_creds.password:
-        basic_auth_str = ("%s:%s" % (host_creds.username, host_creds.password)).encode("utf-8")
-        auth_str = "Basic " + base64.standard_b64encode(basic_auth_str).decode("utf-8")
-    elif host_creds.token:
-        auth_str = "Bearer %s" % host_creds.token
-
-    from mlflow.tracking.request_header.registry import resolve_request_headers
-
-    headers = dict({**_DEFAULT_HEADERS, **resolve_request_headers()})
-    if auth_str:
-        headers["Authorization"] = auth_str
-
-    if host_creds.server_cert_path is None:
-        verify = not host_creds.ignore_tls_verification
-    else:
-        verify = host_creds.server_cert_path
+    headers = host_creds.build_headers()
+    if extra_headers:
+        headers.update(extra_headers)
 
     if host_creds.client_cert_path is not None:
         kwargs["cert"] = host_creds.client_cert_path
 
+    session = _get_request_session(verify=host_creds.verify_param, cert=host_creds.client_cert_path)
+
     def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
+        response = session.request(**kwargs)
         time_left = max_rate_limit_interval
         sleep = 1
         while response.status_code == 429 and time_left > 0:
@@ -72,15 +139,18 @@ def http_request(
             )
             time.sleep(sleep)
             time_left -= sleep
-            response = requests.request(**kwargs)
+            response = session.request(**kwargs)
             sleep = min(time_left, sleep * 2)  # sleep for 1, 2, 4, ... seconds;
         return response
 
-    cleaned_hostname = strip_suffix(hostname, "/")
-    url = "%s%s" % (cleaned_hostname, endpoint)
+    url = host_creds.cleaned_host + endpoint
     for i in range(retries):
         response = request_with_ratelimit_retries(
-            max_rate_limit_interval, url=url, headers=headers, verify=verify, **kwargs
+            max_rate_limit_interval,
+            url=url,
+            headers=headers,
+            verify=host_creds.verify_param,
+            **kwargs
         )
         if response.status_code >= 200 and response.status_code < 500:
             return response
@@ -99,14 +169,6 @@ def http_request(
     )
 
 
-def _can_parse_as_json(string):
-    try:
-        json.loads(string)
-        return True
-    except Exception:
-        return False
-
-
 def http_request_safe(host_creds, endpoint, **kwargs):
     """
     Wrapper around ``http_request`` that also verifies that the request succeeds with code 200.
@@ -115,75 +177,127 @@ def http_request_safe(host_creds, endpoint, **kwargs):
     return verify_rest_response(response, endpoint)
 
 
+_JSON_OBJECT_OR_ARRAY_START = re.compile(r"\s*[{\[]")
+
+
+def _can_parse_as_json_object(string):
+    """
+    Cheaply checks whether ``string`` may contain a JSON object or array by looking at its first
+    non-whitespace character. This rejects e.g. HTML error pages without attempting to parse them.
+    """
+    return isinstance(string, str) and _JSON_OBJECT_OR_ARRAY_START.match(string) is not None
+
+
+def _parse_json_object(string):
+    """
+    Parses ``string`` as a JSON object or array, returning ``None`` if it doesn't contain one.
+    """
+    if not _can_parse_as_json_object(string):
+        return None
+    try:
+        return _json.loads(string)
+    except Exception:
+        return None
+
+
 def verify_rest_response(response, endpoint):
     """Verify the return code and format, raise exception if the request was not successful."""
+    _verify_rest_response(response, endpoint)
+    return response
+
+
+def _verify_rest_response(response, endpoint):
+    """
+    Implementation of ``verify_rest_response`` that returns the JSON body parsed while verifying
+    the response so that callers don't have to parse it again, or ``None`` if the body was not
+    parsed.
+    """
     if response.status_code != 200:
-        if _can_parse_as_json(response.text):
-            raise RestException(json.loads(response.text))
-        else:
+        js_dict = _parse_json_object(response.text)
+        if js_dict is None:
             base_msg = "API request to endpoint %s failed with error code " "%s != 200" % (
                 endpoint,
                 response.status_code,
             )
             raise MlflowException("%s. Response body: '%s'" % (base_msg, response.text))
+        raise RestException(js_dict)
 
     # Skip validation for endpoints (e.g. DBFS file-download API) which may return a non-JSON
     # response
-    if endpoint.startswith(_REST_API_PATH_PREFIX) and not _can_parse_as_json(response.text):
+    if not endpoint.startswith(_REST_API_PATH_PREFIX):
+        return None
+    js_dict = _parse_json_object(response.text)
+    if js_dict is None:
         base_msg = (
             "API request to endpoint was successful but the response body was not "
             "in a valid JSON format"
         )
         raise MlflowException("%s. Response body: '%s'" % (base_msg, response.text))
-
-    return response
+    return js_dict
 
 
 def _get_path(path_prefix, endpoint_path):
     return "{}{}".format(path_prefix, endpoint_path)
 
 
+@lru_cache(maxsize=None)
 def extract_api_info_for_service(service, path_prefix):
-    """ Return a dictionary mapping each API method to a tuple (path, HTTP method)"""
+    """
+    Return a read-only dictionary mapping each API method to a tuple (path, HTTP method).
+    The result is cached per ``(service, path_prefix)`` pair.
+    """
     service_methods = service.DESCRIPTOR.methods
+    service_instance = service()
     res = {}
     for service_method in service_methods:
         endpoints = service_method.GetOptions().Extensions[databricks_pb2.rpc].endpoints
         endpoint = endpoints[0]
         endpoint_path = _get_path(path_prefix, endpoint.path)
-        res[service().GetRequestClass(service_method)] = (endpoint_path, endpoint.method)
-    return res
+        res[service_instance.GetRequestClass(service_method)] = (endpoint_path, endpoint.method)
+    return MappingProxyType(res)
 
 
 def call_endpoint(host_creds, endpoint, method, json_body, response_proto):
-    # Convert json string to json dictionary, to pass to requests
-    if json_body:
-        json_body = json.loads(json_body)
+    """
+    Calls the specified REST endpoint and parses the response into ``response_proto``.
+
+    :param json_body: Request body, either as a dictionary or as an already serialized JSON
+        string. Serialized bodies are sent as-is rather than decoded and re-encoded.
+    """
+    js_dict = _call_endpoint_json(host_creds, endpoint, method, json_body)
+    parse_dict(js_dict=js_dict, message=response_proto)
+    return response_proto
+
+
+def _call_endpoint_json(host_creds, endpoint, method, json_body):
+    """
+    Implementation of ``call_endpoint`` that returns the parsed JSON response body.
+    """
+    if isinstance(json_body, (bytes, str)) and not json_body:
+        json_body = None
     if method == "GET":
+        # Query parameters must be passed to requests as a dictionary
+        if isinstance(json_body, (bytes, str)):
+            json_body = json.loads(json_body)
         response = http_request(
             host_creds=host_creds, endpoint=endpoint, method=method, params=json_body
         )
+    elif isinstance(json_body, (bytes, str)):
+        response = http_request(
+            host_creds=host_creds,
+            endpoint=endpoint,
+            method=method,
+            data=json_body,
+            extra_headers={"Content-Type": "application/json"},
+        )
     else:
         response = http_request(
             host_creds=host_creds, endpoint=endpoint, method=method, json=json_body
         )
-    response = verify_rest_response(response, endpoint)
-    js_dict = json.loads(response.text)
-    parse_dict(js_dict=js_dict, message=response_proto)
-    return response_proto
-
-
-# Response codes that generally indicate transient network failures and merit client retries,
-# based on guidance from cloud service providers
-# (https://docs.microsoft.com/en-us/azure/architecture/best-practices/retry-service-specific#general-rest-and-retry-guidelines)
-TRANSIENT_FAILURE_RESPONSE_CODES = [
-    408,  # Request Timeout
-    429,  # Too Many Requests
-    500,  # Internal Server Error
-    502,  # Bad Gateway
-    503,  # Service Unavailable
-    504,  # Gateway Timeout
-]
+    js_dict = _verify_rest_response(response, endpoint)
+    if js_dict is None:
+        js_dict = _json.loads(response.text)
+    return js_dict
 
 
 @contextmanager
@@ -204,32 +318,18 @@ def cloud_storage_http_request(method, *args, **kwargs):
     :kwargs: Keyword arguments to pass to `requests.Session.put/get()`
     """
     retry_attempts = kwargs.get("retry_attempts", 5)
-    retry_strategy = Retry(
-        total=None,
-        # Don't retry on connect-related errors raised before a request reaches a remote server
-        connect=0,
-        # Retry once for errors reading the response from a remote server
-        read=1,
-        # Limit the number of redirects to avoid infinite redirect loops
-        redirect=3,
-        # Retry a specified number of times for response codes indicating transient failures
-        status=retry_attempts,
-        status_forcelist=TRANSIENT_FAILURE_RESPONSE_CODES,
-        backoff_factor=1,
+    http = _get_request_session(
+        status_retries=retry_attempts, retry_codes=tuple(TRANSIENT_FAILURE_RESPONSE_CODES)
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
-    with requests.Session() as http:
-        http.mount("https://", adapter)
-        http.mount("http://", adapter)
-        if method.lower() == "put":
-            response = http.put(*args, **kwargs)
-        elif method.lower() == "get":
-            response = http.get(*args, **kwargs)
-        else:
-            raise ValueError("Illegal http method: " + method)
+    if method.lower() == "put":
+        response = http.put(*args, **kwargs)
+    elif method.lower() == "get":
+        response = http.get(*args, **kwargs)
+    else:
+        raise ValueError("Illegal http method: " + method)
 
-        with response as r:
-            yield r
+    with response as r:
+        yield r
 
 
 class MlflowHostCreds(object):
@@ -288,3 +388,32 @@ class MlflowHostCreds(object):
         self.ignore_tls_verification = ignore_tls_verification
         self.client_cert_path = client_cert_path
         self.server_cert_path = server_cert_path
+
+        # Values derived from the parameters above that are needed for every request
+        self.cleaned_host = strip_suffix(host, "/")
+        if server_cert_path is None:
+            self.verify_param = not ignore_tls_verification
+        else:
+            self.verify_param = server_cert_path
+        if username and password:
+            basic_auth_str = ("%s:%s" % (username, password)).encode("utf-8")
+            self._auth_header = "Basic " + base64.standard_b64encode(basic_auth_str).decode("utf-8")
+        elif token:
+            self._auth_header = "Bearer %s" % token
+        else:
+            self._auth_header = None
+
+    def build_headers(self):
+        """
+        Returns a new dictionary containing the default MLflow client headers, the headers
+        provided by registered request header providers and the authentication header for
+        these credentials, which is computed once when the credentials are created.
+        """
+        from mlflow.tracking.request_header.registry import resolve_request_headers
+
+        # Request header providers may return different headers depending on the context in which
+        # a request is made, so they are resolved for every request rather than cached
+        headers = {**_DEFAULT_HEADERS, **resolve_request_headers()}
+        if self._auth_header:
+            headers["Authorization"] = self._auth_header
+        return headers
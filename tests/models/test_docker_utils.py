@@ -0,0 +1,159 @@
+import os
+import shutil
+from unittest import mock
+
+import pytest
+
+from mlflow.models import docker_utils
+
+
+@pytest.fixture
+def mlflow_home(tmpdir):
+    home = tmpdir.mkdir("mlflow")
+    home.join("setup.py").write("")
+    home.join(".dockerignore").write("tests\n")
+    home.mkdir("mlflow").join("__init__.py").write("")
+    home.mkdir("tests").join("test_something.py").write("")
+    return str(home)
+
+
+@pytest.fixture(autouse=True)
+def clear_mlflow_home_copies():
+    docker_utils._remove_mlflow_home_copies()
+    yield
+    docker_utils._remove_mlflow_home_copies()
+
+
+def test_copy_mlflow_home_reuses_sanitized_copy(mlflow_home, tmpdir):
+    first_context = tmpdir.mkdir("first")
+    second_context = tmpdir.mkdir("second")
+    with mock.patch(
+        "mlflow.models.docker_utils._copy_project", wraps=docker_utils._copy_project
+    ) as copy_project_mock:
+        mlflow_dir = docker_utils._copy_mlflow_home(mlflow_home, str(first_context))
+        assert docker_utils._copy_mlflow_home(mlflow_home, str(second_context)) == mlflow_dir
+        assert copy_project_mock.call_count == 1
+
+    for context in [first_context, second_context]:
+        copied_dir = os.path.join(str(context), mlflow_dir)
+        assert os.path.exists(os.path.join(copied_dir, "setup.py"))
+        assert os.path.exists(os.path.join(copied_dir, "mlflow", "__init__.py"))
+        assert not os.path.exists(os.path.join(copied_dir, "tests"))
+
+
+def test_copy_mlflow_home_copies_again_when_source_changes(mlflow_home, tmpdir):
+    with mock.patch(
+        "mlflow.models.docker_utils._copy_project", wraps=docker_utils._copy_project
+    ) as copy_project_mock:
+        docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("first")))
+        with open(os.path.join(mlflow_home, "mlflow", "__init__.py"), "w") as f:
+            f.write("changed = True\n")
+        mlflow_dir = docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("second")))
+        assert copy_project_mock.call_count == 2
+
+    with open(os.path.join(str(tmpdir), "second", mlflow_dir, "mlflow", "__init__.py")) as f:
+        assert f.read() == "changed = True\n"
+
+
+def test_copy_mlflow_home_ignores_changes_to_ignored_files(mlflow_home, tmpdir):
+    docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("first")))
+    fingerprint = docker_utils._fingerprint_mlflow_home(mlflow_home)
+    with open(os.path.join(mlflow_home, "tests", "test_something.py"), "w") as f:
+        f.write("changed = True\n")
+    assert docker_utils._fingerprint_mlflow_home(mlflow_home) == fingerprint
+
+
+def test_copy_mlflow_home_removes_failed_copy(mlflow_home, tmpdir):
+    copy_dir = str(tmpdir.mkdir("copy"))
+    with mock.patch("tempfile.mkdtemp", return_value=copy_dir), mock.patch(
+        "mlflow.models.docker_utils._copy_project", side_effect=OSError("copy failed")
+    ):
+        with pytest.raises(OSError, match="copy failed"):
+            docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("first")))
+    assert not os.path.exists(copy_dir)
+    assert not docker_utils._MLFLOW_HOME_COPIES
+
+
+def test_copy_mlflow_home_copies_again_when_cached_copy_is_removed(mlflow_home, tmpdir):
+    docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("first")))
+    (copy_dir,) = docker_utils._MLFLOW_HOME_COPIES.values()
+    shutil.rmtree(copy_dir)
+    mlflow_dir = docker_utils._copy_mlflow_home(mlflow_home, str(tmpdir.mkdir("second")))
+    assert os.path.exists(os.path.join(str(tmpdir), "second", mlflow_dir, "setup.py"))
+    (new_copy_dir,) = docker_utils._MLFLOW_HOME_COPIES.values()
+    assert os.path.exists(new_copy_dir)
+
+
+@pytest.fixture
+def popen_mock():
+    proc = mock.MagicMock()
+    proc.stdout.read1.side_effect = [b"Step 1/2 : FROM ubuntu\n", b""]
+    proc.wait.return_value = 0
+    with mock.patch("mlflow.models.docker_utils.Popen", return_value=proc) as popen_mock:
+        yield popen_mock
+
+
+def test_build_image_uses_buildkit_with_inline_cache(popen_mock):
+    docker_utils._build_image("my-image", entrypoint="ENTRYPOINT []")
+    args, kwargs = popen_mock.call_args
+    docker_args = args[0]
+    assert docker_args[:3] == ["docker", "build", "-t"]
+    assert docker_args[docker_args.index("--cache-from") + 1] == "my-image"
+    assert docker_args[docker_args.index("--build-arg") + 1] == "BUILDKIT_INLINE_CACHE=1"
+    assert kwargs["env"]["DOCKER_BUILDKIT"] == "1"
+
+
+def test_build_image_forwards_build_output_with_split_multibyte_characters(popen_mock):
+    # "é" is encoded as two bytes, which are returned by separate reads
+    encoded = "Step 1/2 : café\n".encode("utf-8")
+    split = encoded.index("é".encode("utf-8")) + 1
+    popen_mock.return_value.stdout.read1.side_effect = [encoded[:split], encoded[split:], b""]
+    with mock.patch("mlflow.models.docker_utils.eprint") as eprint_mock:
+        docker_utils._build_image("my-image", entrypoint="ENTRYPOINT []")
+    forwarded = "".join(args[0] for args, _ in eprint_mock.call_args_list)
+    assert forwarded == "Step 1/2 : café\n"
+    assert "\ufffd" not in forwarded
+
+
+def test_build_image_dockerfile_uses_apt_cache_mounts(popen_mock):
+    dockerfiles = []
+
+    def read_dockerfile(*args, **kwargs):
+        with open(os.path.join(kwargs["cwd"], "Dockerfile")) as f:
+            dockerfiles.append(f.read())
+        return popen_mock.return_value
+
+    popen_mock.side_effect = read_dockerfile
+    docker_utils._build_image("my-image", entrypoint="ENTRYPOINT []")
+    dockerfile = dockerfiles[0]
+    # Parser directives are only recognized on the very first lines of a Dockerfile
+    assert dockerfile.startswith("# syntax=docker/dockerfile:1.4\n")
+    assert "--mount=type=cache,target=/var/cache/apt,sharing=locked" in dockerfile
+    assert "--mount=type=cache,target=/var/lib/apt,sharing=locked" in dockerfile
+
+
+def test_build_image_lists_context_files_only_at_debug_level(popen_mock):
+    with mock.patch("mlflow.models.docker_utils._logger") as logger_mock, mock.patch(
+        "os.system"
+    ) as system_mock:
+        logger_mock.isEnabledFor.return_value = False
+        docker_utils._build_image("my-image", entrypoint="ENTRYPOINT []")
+        logger_mock.debug.assert_not_called()
+
+        logger_mock.isEnabledFor.return_value = True
+        docker_utils._build_image("my-image", entrypoint="ENTRYPOINT []")
+        logged_paths = [call[0][1] for call in logger_mock.debug.call_args_list]
+        assert any(path.endswith("Dockerfile") for path in logged_paths)
+        system_mock.assert_not_called()
+
+
+def test_get_mlflow_install_step_excludes_unneeded_mlflow_home_paths(mlflow_home, tmpdir):
+    context_dir = str(tmpdir.mkdir("context"))
+    docker_utils._get_mlflow_install_step(context_dir, mlflow_home)
+    with open(os.path.join(context_dir, ".dockerignore")) as f:
+        patterns = f.read().splitlines()
+    assert "mlflow-project/.git" in patterns
+    assert "mlflow-project/tests" in patterns
+    assert "mlflow-project/**/*.pyc" in patterns
+    # Only the MLflow source tree is affected, e.g. model artifacts copied into the context are not
+    assert all(pattern.startswith("mlflow-project/") for pattern in patterns)
@@ -34,17 +34,20 @@ from mlflow.protos.service_pb2 import (
     GetExperimentByName,
     ListExperiments,
     LogModel,
+    GetRun,
 )
 from mlflow.protos.databricks_pb2 import (
     RESOURCE_DOES_NOT_EXIST,
     ENDPOINT_NOT_FOUND,
     REQUEST_LIMIT_EXCEEDED,
     INTERNAL_ERROR,
+    INVALID_PARAMETER_VALUE,
     ErrorCode,
 )
 from mlflow.store.tracking.rest_store import (
     RestStore,
     DatabricksRestStore,
+    call_endpoints_batched,
 )
 from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import MlflowHostCreds, _DEFAULT_HEADERS
@@ -67,7 +70,7 @@ def mock_http_request():
 
 
 class TestRestStore(object):
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -90,7 +93,7 @@ class TestRestStore(object):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request(self, request):
         response = mock.MagicMock()
         response.status_code = 404
@@ -102,7 +105,7 @@ class TestRestStore(object):
             store.list_experiments()
         assert "RESOURCE_DOES_NOT_EXIST: No experiment" in str(cm.value)
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request_custom_handler(self, request):
         response = mock.MagicMock()
         response.status_code = 404
@@ -113,7 +116,7 @@ class TestRestStore(object):
         with pytest.raises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -473,5 +476,125 @@ class TestRestStore(object):
                 assert experiments.token == next_page_tokens[idx]
 
 
+def _mock_log_batch_response(request):
+    response = mock.MagicMock()
+    response.status_code = 200
+    response.text = "{}"
+    request.return_value = response
+
+
+@mock.patch("requests.Session.request")
+def test_call_endpoints_batched_coalesces_requests(request):
+    _mock_log_batch_response(request)
+    host_only = MlflowHostCreds("http://my-host")
+    endpoint = "/api/2.0/mlflow/runs/log-batch"
+    metrics = [{"key": "m", "value": i, "timestamp": 0, "step": i} for i in range(1500)]
+    requests_iter = [
+        (
+            endpoint,
+            "POST",
+            {"run_id": "1", "params": [{"key": "p", "value": "v"}]},
+            LogBatch.Response(),
+        ),
+        (endpoint, "POST", json.dumps({"run_id": "2", "tags": []}), LogBatch.Response()),
+        (endpoint, "POST", {"run_id": "1", "metrics": metrics}, LogBatch.Response()),
+    ]
+    responses = call_endpoints_batched(host_only, requests_iter)
+
+    # The caller's response protos are returned in input order
+    assert len(responses) == 3
+    assert all(r is req[3] for r, req in zip(responses, requests_iter))
+    # Run "2" has nothing to log; run "1" is split to respect the per-request metric limit
+    bodies = [call[1]["json"] for call in request.call_args_list]
+    assert [b["run_id"] for b in bodies] == ["1", "1"]
+    assert bodies[0]["params"] == [{"key": "p", "value": "v"}]
+    assert bodies[0]["metrics"] == metrics[:999]
+    assert bodies[1]["params"] == []
+    assert bodies[1]["metrics"] == metrics[999:]
+
+
+@mock.patch("requests.Session.request")
+def test_call_endpoints_batched_converts_single_entry_requests(request):
+    _mock_log_batch_response(request)
+    host_only = MlflowHostCreds("http://my-host")
+    metric = {"key": "m", "value": 1.0, "timestamp": 123, "step": 2}
+    requests_iter = [
+        (
+            "/api/2.0/mlflow/runs/log-metric",
+            "POST",
+            {"run_id": "1", **metric},
+            LogMetric.Response(),
+        ),
+        (
+            "/api/2.0/mlflow/runs/log-parameter",
+            "POST",
+            json.dumps({"run_uuid": "1", "key": "p", "value": "v"}),
+            LogParam.Response(),
+        ),
+        (
+            "/api/2.0/mlflow/runs/set-tag",
+            "POST",
+            {"run_id": "1", "key": "t", "value": "x"},
+            SetTag.Response(),
+        ),
+    ]
+    responses = call_endpoints_batched(host_only, requests_iter)
+
+    assert [type(r) for r in responses] == [
+        LogMetric.Response,
+        LogParam.Response,
+        SetTag.Response,
+    ]
+    request.assert_called_once()
+    _, kwargs = request.call_args
+    assert kwargs["url"] == "http://my-host/api/2.0/mlflow/runs/log-batch"
+    assert kwargs["json"] == {
+        "run_id": "1",
+        "metrics": [metric],
+        "params": [{"key": "p", "value": "v"}],
+        "tags": [{"key": "t", "value": "x"}],
+    }
+
+
+@pytest.mark.parametrize(
+    "batched_request",
+    [
+        ("/api/2.0/mlflow/runs/get", "GET", {"run_id": "1"}, GetRun.Response()),
+        ("/api/2.0/mlflow/runs/log-batch", "GET", {"run_id": "1"}, LogBatch.Response()),
+        ("/api/2.0/mlflow/runs/log-batch", "POST", None, LogBatch.Response()),
+        ("/api/2.0/mlflow/runs/log-batch", "POST", "[]", LogBatch.Response()),
+        ("/api/2.0/mlflow/runs/log-batch", "POST", {"metrics": []}, LogBatch.Response()),
+        ("/api/2.0/mlflow/runs/log-batch", "POST", {"run_id": None}, LogBatch.Response()),
+        (
+            "/api/2.0/mlflow/runs/log-batch",
+            "POST",
+            {"run_id": "1", "metric": [{"key": "m", "value": 1.0}]},
+            LogBatch.Response(),
+        ),
+        (
+            "/api/2.0/mlflow/runs/log-metric",
+            "POST",
+            {"run_id": "1", "key": "m", "value": 1.0, "tags": []},
+            LogMetric.Response(),
+        ),
+    ],
+)
+@mock.patch("requests.Session.request")
+def test_call_endpoints_batched_rejects_invalid_requests(request, batched_request):
+    _mock_log_batch_response(request)
+    host_only = MlflowHostCreds("http://my-host")
+    valid_request = (
+        "/api/2.0/mlflow/runs/log-batch",
+        "POST",
+        {"run_id": "1", "params": [{"key": "p", "value": "v"}]},
+        LogBatch.Response(),
+    )
+    with pytest.raises(MlflowException) as e:
+        call_endpoints_batched(host_only, [valid_request, batched_request])
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    # Nothing is sent unless every request is valid
+    request.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
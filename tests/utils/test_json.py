@@ -0,0 +1,48 @@
+import math
+from unittest import mock
+
+import pytest
+
+from mlflow.utils import _json
+
+
+@pytest.mark.parametrize("document", ['{"a": [1, 2.5, "b", null]}', b'{"a": [1, 2.5, "b", null]}'])
+def test_loads(document):
+    assert _json.loads(document) == {"a": [1, 2.5, "b", None]}
+
+
+def test_loads_non_standard_documents():
+    assert math.isnan(_json.loads('{"a": NaN}')["a"])
+    assert _json.loads(str(2 ** 70)) == 2 ** 70
+
+
+def test_loads_falls_back_to_json_when_orjson_rejects_document():
+    class JSONDecodeError(ValueError):
+        pass
+
+    fake_orjson = mock.Mock(JSONDecodeError=JSONDecodeError)
+    fake_orjson.loads.side_effect = JSONDecodeError("unsupported document")
+    with mock.patch("mlflow.utils._json.orjson", fake_orjson):
+        assert math.isnan(_json.loads('{"a": NaN}')["a"])
+    fake_orjson.loads.assert_called_once_with('{"a": NaN}')
+
+
+def test_loads_uses_orjson_when_installed():
+    fake_orjson = mock.Mock(JSONDecodeError=ValueError)
+    fake_orjson.loads.return_value = {"a": 1}
+    with mock.patch("mlflow.utils._json.orjson", fake_orjson), mock.patch(
+        "json.loads"
+    ) as json_loads_mock:
+        assert _json.loads('{"a": 1}') == {"a": 1}
+    json_loads_mock.assert_not_called()
+
+
+def test_loads_without_orjson():
+    with mock.patch("mlflow.utils._json.orjson", None):
+        assert _json.loads('{"a": 1}') == {"a": 1}
+
+
+@pytest.mark.parametrize("document", ["<html></html>", "", None])
+def test_loads_invalid_document(document):
+    with pytest.raises((ValueError, TypeError)):
+        _json.loads(document)
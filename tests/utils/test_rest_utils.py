@@ -1,8 +1,12 @@
 #!/usr/bin/env python
 
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from unittest import mock
 import numpy
 import pytest
+import requests
 
 from mlflow.exceptions import MlflowException, RestException
 from mlflow.pyfunc.scoring_server import NumpyEncoder
@@ -12,13 +16,18 @@ from mlflow.utils.rest_utils import (
     MlflowHostCreds,
     _DEFAULT_HEADERS,
     call_endpoint,
+    cloud_storage_http_request,
+    extract_api_info_for_service,
+    _can_parse_as_json_object,
+    _get_request_session,
+    _REST_API_PATH_PREFIX,
 )
-from mlflow.protos.service_pb2 import GetRun
+from mlflow.protos.service_pb2 import GetRun, LogBatch, MlflowService
 from tests import helper_functions
 
 
 def test_well_formed_json_error_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 400
@@ -31,7 +40,7 @@ def test_well_formed_json_error_response():
 
 
 def test_non_json_ok_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 200
@@ -56,7 +65,7 @@ def test_non_json_ok_response():
     ],
 )
 def test_malformed_json_error_response(response_mock):
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         request_mock.return_value = response_mock
 
@@ -65,7 +74,23 @@ def test_malformed_json_error_response(response_mock):
             call_endpoint(host_only, "/my/endpoint", "GET", "", response_proto)
 
 
-@mock.patch("requests.request")
+@pytest.mark.parametrize(
+    ("string", "expected"),
+    [
+        ("{}", True),
+        ('  \n{"error_code": "INTERNAL_ERROR"}', True),
+        ("[1, 2]", True),
+        ("<html></html>", False),
+        ("", False),
+        ("   ", False),
+        (None, False),
+    ],
+)
+def test_can_parse_as_json_object(string, expected):
+    assert _can_parse_as_json_object(string) == expected
+
+
+@mock.patch("requests.Session.request")
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -77,7 +102,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -90,7 +115,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username="user", password="pass")
     response = mock.MagicMock()
@@ -104,7 +129,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token="my-token")
     response = mock.MagicMock()
@@ -118,7 +143,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -130,7 +155,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_client_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", client_cert_path="/some/path")
     response = mock.MagicMock()
@@ -142,7 +167,7 @@ def test_http_request_client_cert_path(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_server_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", server_cert_path="/some/path")
     response = mock.MagicMock()
@@ -155,7 +180,7 @@ def test_http_request_server_cert_path(request):
 
 
 @pytest.mark.large
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_request_headers(request):
     """This test requires the package in tests/resources/mlflow-test-plugin to be installed"""
 
@@ -178,6 +203,91 @@ def test_http_request_request_headers(request):
         )
 
 
+@mock.patch("requests.Session.request")
+def test_http_request_reuses_session(request):
+    host_only = MlflowHostCreds("http://my-host")
+    response = mock.MagicMock()
+    response.status_code = 200
+    request.return_value = response
+    _get_request_session.cache_clear()
+    with mock.patch("requests.Session", wraps=requests.Session) as session_mock:
+        http_request(host_only, "/my/endpoint")
+        http_request(host_only, "/my/other/endpoint")
+        assert session_mock.call_count == 1
+    _get_request_session.cache_clear()
+    assert request.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "first_creds, second_creds",
+    [
+        (
+            MlflowHostCreds("https://my-host", ignore_tls_verification=True),
+            MlflowHostCreds("https://my-host"),
+        ),
+        (
+            MlflowHostCreds("https://my-host", client_cert_path="/some/path"),
+            MlflowHostCreds("https://my-host", client_cert_path="/some/other/path"),
+        ),
+    ],
+)
+def test_http_request_does_not_share_sessions_across_tls_settings(first_creds, second_creds):
+    response = mock.MagicMock()
+    response.status_code = 200
+    _get_request_session.cache_clear()
+    with mock.patch("requests.Session.request", autospec=True, return_value=response) as request:
+        http_request(first_creds, "/my/endpoint", method="GET")
+        http_request(second_creds, "/my/endpoint", method="GET")
+    _get_request_session.cache_clear()
+    (first_session, *_), _ = request.call_args_list[0]
+    (second_session, *_), _ = request.call_args_list[1]
+    assert first_session is not second_session
+    for session, creds in [(first_session, first_creds), (second_session, second_creds)]:
+        assert session.verify == creds.verify_param
+        assert session.cert == creds.client_cert_path
+
+
+@pytest.fixture
+def cookie_server():
+    received_cookies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            received_cookies.append(self.headers.get("Cookie"))
+            self.send_response(200)
+            self.send_header("Set-Cookie", "session=%s" % self.headers["Authorization"][-1])
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"{}")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%d" % server.server_port, received_cookies
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_request_does_not_send_cookies_from_previous_responses(cookie_server):
+    host, received_cookies = cookie_server
+    http_request(MlflowHostCreds(host, token="A"), "/my/endpoint", method="GET")
+    http_request(MlflowHostCreds(host, token="B"), "/my/endpoint", method="GET")
+    assert received_cookies == [None, None]
+
+
+def test_cloud_storage_http_request_does_not_send_cookies_from_previous_responses(cookie_server):
+    host, received_cookies = cookie_server
+    for token in ["A", "B"]:
+        with cloud_storage_http_request(
+            "get", host + "/presigned", headers={"Authorization": "Bearer " + token}
+        ) as response:
+            assert response.status_code == 200
+    assert received_cookies == [None, None]
+
+
 def test_ignore_tls_verification_not_server_cert_path():
     with pytest.raises(MlflowException):
         MlflowHostCreds(
@@ -185,7 +295,7 @@ def test_ignore_tls_verification_not_server_cert_path():
         )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_429_retries(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
 
@@ -215,7 +325,7 @@ def test_429_retries(request):
     assert http_request(host_only, "/my/endpoint", retries=2).status_code == 200
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -245,6 +355,32 @@ def test_http_request_wrapper(request):
         http_request_safe(host_only, "/my/endpoint")
 
 
+@pytest.mark.parametrize("json_body", [{"run_id": "1"}, '{"run_id": "1"}'])
+def test_call_endpoint_post_body(json_body):
+    host_only = MlflowHostCreds("http://my-host")
+    with mock.patch(
+        "mlflow.utils.rest_utils.http_request",
+        return_value=mock.MagicMock(status_code=200, text="{}"),
+    ) as http_request_mock:
+        call_endpoint(host_only, "/api/2.0/my/endpoint", "POST", json_body, GetRun.Response())
+        kwargs = http_request_mock.call_args[1]
+        if isinstance(json_body, str):
+            # Serialized bodies are sent as-is instead of being decoded and re-encoded
+            assert kwargs["data"] == json_body
+            assert kwargs["extra_headers"] == {"Content-Type": "application/json"}
+        else:
+            assert kwargs["json"] == json_body
+
+
+def test_extract_api_info_for_service():
+    api_info = extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX)
+    assert api_info[GetRun] == ("/api/2.0/mlflow/runs/get", "GET")
+    assert api_info[LogBatch] == ("/api/2.0/mlflow/runs/log-batch", "POST")
+    assert extract_api_info_for_service(MlflowService, _REST_API_PATH_PREFIX) is api_info
+    with pytest.raises(TypeError):
+        api_info[GetRun] = ("/some/other/path", "POST")
+
+
 def test_numpy_encoder():
     test_number = numpy.int64(42)
     ne = NumpyEncoder()
@@ -3,6 +3,7 @@ import pytest
 
 from mlflow.utils import (
     get_unique_resource_id,
+    _chunk_batch_entities,
     _chunk_dict,
     _truncate_dict,
     _get_fully_qualified_class_name,
@@ -77,6 +78,20 @@ def test_chunk_dict():
     assert list(_chunk_dict(d, len(d) + 1)) == [d]
 
 
+def test_chunk_batch_entities():
+    metrics = list(range(3000))
+    params = list(range(150))
+    batches = list(_chunk_batch_entities(metrics, params, tags=[1]))
+    # Metrics fill up the batches containing params and tags before being batched on their own
+    assert batches == [
+        (metrics[:899], params[:100], [1]),
+        (metrics[899:1849], params[100:], []),
+        (metrics[1849:2849], [], []),
+        (metrics[2849:], [], []),
+    ]
+    assert list(_chunk_batch_entities([], [], [])) == []
+
+
 def test_get_fully_qualified_class_name():
     class Foo:
         pass